@@ -18,6 +18,10 @@
 #    - Contact postpass duration
 #    - Antenna tracking
 # 3. Show AWS Ground Station reserved minute usage
+# 4. Scan all supported regions for mission profiles and show the one selected
+
+# Set GS_CONFIG_PROFILE_CACHE=1 to keep mission profile listings for 5 minutes
+# in ~/.aws-groundstation-cache, one file per account and region
 
 # It uses your default credentials stored in the /.aws folder
 
@@ -26,212 +30,507 @@
 # boto3 GroundStation reference: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/groundstation.html
 
 
-import regex
+import re
+import copy
+import os
 import json
-import boto3
-from botocore.config import Config
+import time
+import pathlib
+import functools
+import threading
+from enum import Enum
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor
 from PyInquirer import prompt, Separator
 from prompt_toolkit.validation import Validator, ValidationError
 
 
-def get_mission_profile_list(gs_client):
-    mission_profile_list = []
+@functools.lru_cache(maxsize=None)
+def get_botocore_session():
+    import botocore.session
+
+    return botocore.session.get_session()
+
+
+@functools.lru_cache(maxsize=None)
+def get_session():
+    # A single session shares the botocore loader, service model and credential
+    # resolution between every client the tool creates. boto3 is imported here
+    # so the first menu is shown without waiting for it to load.
+    import boto3
+
+    return boto3.session.Session(botocore_session=get_botocore_session())
+
+
+def load_service_models():
+    # Parsing the service definitions is the slow part of creating the first
+    # clients. The session's loader keeps what it parsed, so clients created
+    # later reuse it.
+    get_session()
+
+    for service_name in ("sts", "groundstation"):
+        get_botocore_session().get_service_model(service_name)
+
+
+def run_in_background(function):
+    # Runs function on a daemon thread, so quitting doesn't wait for it, and
+    # returns a future for its result
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(function())
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+
+    return future
+
+
+class Action(Enum):
+    DONE = "done"
+    SKIPPED = "skipped"
+    QUIT = "quit"
+
+
+@dataclass
+class SessionState:
+    # Region and client chosen in the main menu, kept until the user picks
+    # "Change region". Regions the account was denied access to are
+    # remembered so they aren't retried.
+    region: str = ""
+    full_region: str = ""
+    gs_client: object = None
+    inaccessible_regions: set = field(default_factory=set)
+
+
+class CachedClient:
+    # Wraps a boto3 groundstation client so that repeated reads within a session
+    # are served from memory. Results are deep copied because callers edit them
+    # before passing them back to the update calls, which clear the cache.
+
+    def __init__(self, gs_client):
+        self._gs_client = gs_client
+        self._get_config = functools.lru_cache(maxsize=256)(gs_client.get_config)
+        self._get_mission_profile = functools.lru_cache(maxsize=256)(
+            gs_client.get_mission_profile
+        )
+        self._get_dataflow_endpoint_group = functools.lru_cache(maxsize=256)(
+            gs_client.get_dataflow_endpoint_group
+        )
+
+    def __getattr__(self, name):
+        return getattr(self._gs_client, name)
+
+    def get_config(self, **kwargs):
+        return copy.deepcopy(self._get_config(**kwargs))
+
+    def get_mission_profile(self, **kwargs):
+        return copy.deepcopy(self._get_mission_profile(**kwargs))
+
+    def get_dataflow_endpoint_group(self, **kwargs):
+        return copy.deepcopy(self._get_dataflow_endpoint_group(**kwargs))
+
+    def update_config(self, **kwargs):
+        try:
+            return self._gs_client.update_config(**kwargs)
+        finally:
+            self.cache_clear()
+
+    def update_mission_profile(self, **kwargs):
+        try:
+            return self._gs_client.update_mission_profile(**kwargs)
+        finally:
+            self.cache_clear()
+            clear_profile_cache(self._gs_client)
+
+    def cache_clear(self):
+        self._get_config.cache_clear()
+        self._get_mission_profile.cache_clear()
+        self._get_dataflow_endpoint_group.cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def get_account_id():
+    # A single cheap STS call per run confirms the credentials work before any
+    # Ground Station region is contacted
+    return get_session().client("sts").get_caller_identity()["Account"]
+
+
+@functools.lru_cache(maxsize=None)
+def get_gs_client(region):
+    # One client per region for the whole session, so its connection pool is
+    # reused across menu actions instead of being rebuilt every time.
+    from botocore.config import Config
+
+    my_config = Config(
+        region_name=region,
+        signature_version="v4",
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        max_pool_connections=50,
+        tcp_keepalive=True,
+    )
+
+    return CachedClient(get_session().client("groundstation", config=my_config))
+
+
+# When GS_CONFIG_PROFILE_CACHE=1 is set, mission profile listings are saved per
+# account and region so that runs started shortly after each other don't list
+# them again. Profiles created or deleted elsewhere show up once it expires.
+PROFILE_CACHE_ENABLED = os.environ.get("GS_CONFIG_PROFILE_CACHE") == "1"
+PROFILE_CACHE_DIR = pathlib.Path.home() / ".aws-groundstation-cache"
+PROFILE_CACHE_TTL = 300
 
-    responce = gs_client.list_mission_profiles()
 
-    mission_profile_list.append(
-        Separator("               Name             --   ID      ")
+def get_profile_cache_path(gs_client):
+    return (
+        PROFILE_CACHE_DIR
+        / f"{get_account_id()}-{gs_client.meta.region_name}-profiles.json"
     )
 
-    if responce["missionProfileList"]:
-        for profile in responce["missionProfileList"]:
-            mission_profile_details = (
-                str(profile["name"]).ljust(30) + "  --  " + profile["missionProfileId"]
+
+def clear_profile_cache(gs_client):
+    try:
+        get_profile_cache_path(gs_client).unlink()
+    except OSError:
+        pass
+
+
+def read_profile_cache(gs_client):
+    if not PROFILE_CACHE_ENABLED:
+        return None
+
+    cache_path = get_profile_cache_path(gs_client)
+    try:
+        if time.time() - cache_path.stat().st_mtime < PROFILE_CACHE_TTL:
+            return json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        pass
+
+    return None
+
+
+def write_profile_cache(gs_client, profiles):
+    if not PROFILE_CACHE_ENABLED:
+        return
+
+    cache_path = get_profile_cache_path(gs_client)
+    try:
+        # The file names carry the account ID, so only the user can read them
+        cache_path.parent.mkdir(mode=0o700, exist_ok=True)
+        cache_path.write_text(json.dumps(profiles))
+    except OSError:
+        pass
+
+
+def iter_mission_profiles(gs_client):
+    cached_profiles = read_profile_cache(gs_client)
+    if cached_profiles is not None:
+        yield from cached_profiles
+        return
+
+    # Pages are requested 50 profiles at a time, and the listing is only saved
+    # once every page has been read
+    profiles = []
+    paginator = gs_client.get_paginator("list_mission_profiles")
+    for page in paginator.paginate(PaginationConfig={"PageSize": 50}):
+        profiles.extend(page["missionProfileList"])
+        yield from page["missionProfileList"]
+
+    write_profile_cache(gs_client, profiles)
+
+
+def list_mission_profiles(gs_client):
+    return list(iter_mission_profiles(gs_client))
+
+
+# Error codes meaning the account can't use Ground Station in a region, as
+# opposed to throttling or network errors that are worth retrying
+ACCESS_ERROR_CODES = {"AccessDeniedException", "UnrecognizedClientException"}
+
+
+def is_access_error(error):
+    from botocore.exceptions import ClientError
+
+    return (
+        isinstance(error, ClientError)
+        and error.response["Error"]["Code"] in ACCESS_ERROR_CODES
+    )
+
+
+def scan_mission_profiles(regions):
+    # Clients are created up front because a boto3 session isn't thread safe,
+    # then the listings run concurrently since the clients are for reads
+    clients = [get_gs_client(region) for region in regions]
+
+    def list_region(region, gs_client):
+        try:
+            return region, list_mission_profiles(gs_client)
+        except Exception as e:
+            print(f"Skipping {region}: {e}")
+            # Only regions the account can't access are reported as failed
+            return region, None if is_access_error(e) else []
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(list_region, regions, clients))
+
+    found = [
+        (region, profile)
+        for region, profiles in results
+        if profiles
+        for profile in profiles
+    ]
+    failed = {region for region, profiles in results if profiles is None}
+
+    return found, failed
+
+
+def get_mission_profile_list(gs_client, profiles=None):
+    # Choices are yielded rather than collected, PyInquirer reads them once
+    # when it builds the menu
+    if profiles is None:
+        profiles = iter_mission_profiles(gs_client)
+
+    yield Separator("               Name             --   ID      ")
+
+    # The (name, id) pair is carried as the choice value so callers don't have
+    # to parse it back out of the display string
+    for profile in profiles:
+        yield {
+            "name": f"{profile['name']:<30}  --  {profile['missionProfileId']}",
+            "value": (profile["name"], profile["missionProfileId"]),
+        }
+
+    yield "Exit"
+
+
+def parse_config_arn(config_arn):
+    # config ARNs look like arn:aws:groundstation:<region>:<account>:config/<type>/<id>
+    _, config_type, config_id = config_arn.split("/")
+    return config_id, config_type
+
+
+def find_config_ids(dataflow_edges, target_type):
+    for config_pair in dataflow_edges:
+        for config in config_pair:
+            config_id, config_type = parse_config_arn(config)
+            if config_type == target_type:
+                yield config_id
+
+
+def find_config_id(dataflow_edges, target_type):
+    return next(find_config_ids(dataflow_edges, target_type), None)
+
+
+def get_configs(gs_client, config_ids, config_type):
+    # The configs don't depend on each other, so they're fetched concurrently
+    # and returned in the order of config_ids
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(
+            executor.map(
+                lambda config_id: gs_client.get_config(
+                    configId=config_id, configType=config_type
+                ),
+                config_ids,
             )
-            mission_profile_list.append(mission_profile_details)
-    else:
-        print("No available mission profiles in this region.")
-        main()
+        )
+
+
+def get_endpoint_name(dataflow_endpoint):
+    for endpoint_type in ["endpoint", "awsGroundStationAgentEndpoint"]:
+        if endpoint_type in dataflow_endpoint.keys():
+            return dataflow_endpoint[endpoint_type]["name"]
+    return None
+
+
+# The DFEG listing and the endpoint names in each group are cached per client
+# so that viewing or updating several mission profiles in one session only
+# scans the account's dataflow endpoint groups once. This tool never modifies
+# DFEGs, so the caches do not need to be cleared on update.
+@functools.lru_cache(maxsize=None)
+def list_dataflow_endpoint_group_ids(gs_client):
+    paginator = gs_client.get_paginator("list_dataflow_endpoint_groups")
 
-    mission_profile_list.append("Exit")
+    return tuple(
+        tuple(
+            dataflow_endpoint_group["dataflowEndpointGroupId"]
+            for dataflow_endpoint_group in page["dataflowEndpointGroupList"]
+        )
+        for page in paginator.paginate(PaginationConfig={"PageSize": 100})
+    )
 
-    return mission_profile_list
+
+@functools.lru_cache(maxsize=256)
+def get_dataflow_endpoint_names(gs_client, dataflow_endpoint_group_id):
+    dfg_data = gs_client.get_dataflow_endpoint_group(
+        dataflowEndpointGroupId=dataflow_endpoint_group_id
+    )
+
+    return frozenset(
+        get_endpoint_name(dataflow_endpoint)
+        for dataflow_endpoint in dfg_data["endpointsDetails"]
+        if dataflow_endpoint
+    )
+
+
+def find_dataflow_endpoint_group(gs_client, endpoint_names):
+    # Returns the ID and details of the first DFEG that contains any of the
+    # given endpoint names, or (None, None) if no group matches. Each page of
+    # groups is fetched concurrently and the scan stops at the first match.
+    for dataflow_endpoint_group_ids in list_dataflow_endpoint_group_ids(gs_client):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            group_endpoint_names = list(
+                executor.map(
+                    lambda group_id: get_dataflow_endpoint_names(gs_client, group_id),
+                    dataflow_endpoint_group_ids,
+                )
+            )
+
+        for dataflow_endpoint_group_id, names in zip(
+            dataflow_endpoint_group_ids, group_endpoint_names
+        ):
+            if names & endpoint_names:
+                return (
+                    dataflow_endpoint_group_id,
+                    gs_client.get_dataflow_endpoint_group(
+                        dataflowEndpointGroupId=dataflow_endpoint_group_id
+                    ),
+                )
+
+    return None, None
 
 
 def view_mission_profile(gs_client, mission_profile_id, mission_profile_name):
     print("========================================================================")
     print("========================================================================")
-    print("Mission Profile Name : " + mission_profile_name)
-    print("Mission Profile ID : " + mission_profile_id)
+    print(f"Mission Profile Name : {mission_profile_name}")
+    print(f"Mission Profile ID : {mission_profile_id}")
     print("========================================================================")
     print("========================================================================")
 
-    endpoint_name_list = []
+    endpoint_name_set = set()
 
     profile_data = gs_client.get_mission_profile(missionProfileId=mission_profile_id)
 
     print(
-        "Contact pre-pass duration : "
-        + str(profile_data["contactPrePassDurationSeconds"])
-        + "s"
+        f"Contact pre-pass duration : {profile_data['contactPrePassDurationSeconds']}s"
     )
     print(
-        "Contact post-pass duration : "
-        + str(profile_data["contactPostPassDurationSeconds"])
-        + "s"
+        f"Contact post-pass duration : {profile_data['contactPostPassDurationSeconds']}s"
     )
     print(
-        "Minimum viable contact duration : "
-        + str(profile_data["minimumViableContactDurationSeconds"])
-        + "s"
+        f"Minimum viable contact duration : {profile_data['minimumViableContactDurationSeconds']}s"
     )
 
-    tracking_config_id = profile_data["trackingConfigArn"].split("/")[2]
-    autotrack = gs_client.get_config(
-        configId=tracking_config_id, configType="tracking"
-    )["configData"]["trackingConfig"]["autotrack"]
+    tracking_config_id, _ = parse_config_arn(profile_data["trackingConfigArn"])
+    tracking_config_key = (tracking_config_id, "tracking")
 
-    print("Antenna autotrack : " + autotrack)
+    config_keys = [
+        parse_config_arn(config)
+        for config_pair in profile_data["dataflowEdges"]
+        for config in config_pair
+    ]
 
-    print("")
-    print("")
-    print("Data Flow Edges and their Configs:")
+    # fetch the tracking config and every config referenced by the dataflow
+    # edges concurrently
+    unique_config_keys = list(dict.fromkeys([tracking_config_key] + config_keys))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        configs = dict(
+            zip(
+                unique_config_keys,
+                executor.map(
+                    lambda key: gs_client.get_config(
+                        configId=key[0], configType=key[1]
+                    ),
+                    unique_config_keys,
+                ),
+            )
+        )
 
-    for config_pair in profile_data["dataflowEdges"]:
-        for config in config_pair:
-            config_id = config.split("/")[2]
-            config_type = config.split("/")[1]
-            config_name = gs_client.get_config(
-                configId=config_id, configType=config_type
-            )["name"]
-
-            print("--------------------------------------------------------------")
-            print(config_type + " : " + config_name)
-            print("--------------------------------------------------------------")
-
-            if config_type == "dataflow-endpoint":
-                endpoint_name = gs_client.get_config(
-                    configId=config_id, configType=config_type
-                )["configData"]["dataflowEndpointConfig"]["dataflowEndpointName"]
-                endpoint_name_list.append(endpoint_name)
-
-            config_data = gs_client.get_config(
-                configId=config_id, configType=config_type
-            )["configData"]
-
-            if "antennaDownlinkDemodDecodeConfig" in config_data.keys():
-                decode_config = json.loads(
-                    config_data["antennaDownlinkDemodDecodeConfig"]["decodeConfig"][
-                        "unvalidatedJSON"
-                    ]
-                )
-                decode_json = {}
-                decode_json["unvalidatedJSON"] = decode_config
+    tracking_config = configs[tracking_config_key]
+    autotrack = tracking_config["configData"]["trackingConfig"]["autotrack"]
 
-                demod_config = json.loads(
-                    config_data["antennaDownlinkDemodDecodeConfig"][
-                        "demodulationConfig"
-                    ]["unvalidatedJSON"]
-                )
-                demod_json = {}
-                demod_json["unvalidatedJSON"] = demod_config
+    print(f"Antenna autotrack : {autotrack}")
 
-                combined_config = {}
-                combined_config["decodeConfig"] = decode_json
-                combined_config["demodulationConfig"] = demod_json
-                combined_config["spectrumConfig"] = config_data[
-                    "antennaDownlinkDemodDecodeConfig"
-                ]["spectrumConfig"]
+    print("")
+    print("")
+    print("Data Flow Edges and their Configs:")
 
-                jsondata = {}
-                jsondata["antennaDownlinkDemodDecodeConfig"] = combined_config
+    for config_id, config_type in config_keys:
+        config_name = configs[(config_id, config_type)]["name"]
+        config_data = configs[(config_id, config_type)]["configData"]
 
-                print(json.dumps(jsondata, indent=4))
+        print("--------------------------------------------------------------")
+        print(f"{config_type} : {config_name}")
+        print("--------------------------------------------------------------")
 
-            else:
-                print(json.dumps(config_data, indent=4))
+        if config_type == "dataflow-endpoint":
+            endpoint_name = config_data["dataflowEndpointConfig"][
+                "dataflowEndpointName"
+            ]
+            endpoint_name_set.add(endpoint_name)
+
+        if "antennaDownlinkDemodDecodeConfig" in config_data.keys():
+            # expand the embedded JSON strings so they pretty-print with the rest
+            demod_decode_config = dict(config_data["antennaDownlinkDemodDecodeConfig"])
+            for key in ["decodeConfig", "demodulationConfig"]:
+                demod_decode_config[key] = {
+                    **demod_decode_config[key],
+                    "unvalidatedJSON": json.loads(
+                        demod_decode_config[key]["unvalidatedJSON"]
+                    ),
+                }
 
-    dataflow_endpoint_group_list = gs_client.list_dataflow_endpoint_groups()
+            print(
+                json.dumps(
+                    {"antennaDownlinkDemodDecodeConfig": demod_decode_config}, indent=4
+                )
+            )
 
-    selected_dataflow_endpoint_group_id = ""
+        else:
+            print(json.dumps(config_data, indent=4))
 
     # select the DFEG associated with the mission profile
-    for dataflow_endpoint_group in dataflow_endpoint_group_list[
-        "dataflowEndpointGroupList"
-    ]:
-        dataflow_endpoint_group_id = dataflow_endpoint_group["dataflowEndpointGroupId"]
-        for dataflow_endpoint in gs_client.get_dataflow_endpoint_group(
-            dataflowEndpointGroupId=dataflow_endpoint_group_id
-        )["endpointsDetails"]:
-            if dataflow_endpoint:
-                if "endpoint" in dataflow_endpoint.keys():
-                    endpoint_type = "endpoint"
-                    dataflow_endpoint_name = dataflow_endpoint[endpoint_type]["name"]
-                    if dataflow_endpoint_name in endpoint_name_list:
-                        selected_dataflow_endpoint_group_id = dataflow_endpoint_group_id
-                        break
-                if "awsGroundStationAgentEndpoint" in dataflow_endpoint.keys():
-                    endpoint_type = "awsGroundStationAgentEndpoint"
-                    dataflow_endpoint_name = dataflow_endpoint[endpoint_type]["name"]
-                    if dataflow_endpoint_name in endpoint_name_list:
-                        selected_dataflow_endpoint_group_id = dataflow_endpoint_group_id
-                        break
-
-    dataflow_endpoint_group_id = selected_dataflow_endpoint_group_id
+    dataflow_endpoint_group_id, selected_dfg_data = find_dataflow_endpoint_group(
+        gs_client, endpoint_name_set
+    )
+
     if not dataflow_endpoint_group_id:
         print(
             "There are no dataflow endpoints in this mission profile that are part of a dataflow endpoint group."
         )
-        quit()
+        return
 
-    selected_dfg_data = gs_client.get_dataflow_endpoint_group(
-        dataflowEndpointGroupId=dataflow_endpoint_group_id
-    )
-    dataflow_prepass_duration = str(selected_dfg_data["contactPrePassDurationSeconds"])
-    dataflow_postpass_duration = str(
-        selected_dfg_data["contactPostPassDurationSeconds"]
-    )
+    dataflow_prepass_duration = selected_dfg_data["contactPrePassDurationSeconds"]
+    dataflow_postpass_duration = selected_dfg_data["contactPostPassDurationSeconds"]
 
     print("")
     print("--------------------------------------------------------------")
-    print("Data Flow Endpoint Group ID:                 " + dataflow_endpoint_group_id)
-    print(
-        "Data Flow Endpoint Group pre-pass duration:  "
-        + dataflow_prepass_duration
-        + "s"
-    )
-    print(
-        "Data Flow Endpoint Group post-pass duration: "
-        + dataflow_postpass_duration
-        + "s"
-    )
+    print(f"Data Flow Endpoint Group ID:                 {dataflow_endpoint_group_id}")
+    print(f"Data Flow Endpoint Group pre-pass duration:  {dataflow_prepass_duration}s")
+    print(f"Data Flow Endpoint Group post-pass duration: {dataflow_postpass_duration}s")
     print("Data Flow Endpoints in this Group:")
     print("--------------------------------------------------------------")
 
-    for dataflow_endpoint in gs_client.get_dataflow_endpoint_group(
-        dataflowEndpointGroupId=dataflow_endpoint_group_id
-    )["endpointsDetails"]:
+    for dataflow_endpoint in selected_dfg_data["endpointsDetails"]:
         if "endpoint" in dataflow_endpoint.keys():
             dataflow_endpoint_name = dataflow_endpoint["endpoint"]["name"]
             dataflow_endpoint_IP = dataflow_endpoint["endpoint"]["address"]["name"]
-            dataflow_endpoint_port = str(
-                dataflow_endpoint["endpoint"]["address"]["port"]
-            )
+            dataflow_endpoint_port = dataflow_endpoint["endpoint"]["address"]["port"]
             dataflow_endpoint_status = dataflow_endpoint["endpoint"]["status"]
-            dataflow_endpoint_sg = str(
+            dataflow_endpoint_sg = ", ".join(
                 dataflow_endpoint["securityDetails"]["securityGroupIds"]
-            ).strip("[']")
-            dataflow_endpoint_healthStatus = dataflow_endpoint["healthStatus"]
-            dataflow_endpoint_healthReasons = str(dataflow_endpoint["healthReasons"][0])
-
-            print("Name          : " + dataflow_endpoint_name)
-            print("Status        : " + dataflow_endpoint_status)
-            print("Health Status : " + dataflow_endpoint_healthStatus)
-            print("Health Reason : " + dataflow_endpoint_healthReasons)
-            print("Sec group     : " + dataflow_endpoint_sg)
-            print(
-                "Target:       : " + dataflow_endpoint_IP + ":" + dataflow_endpoint_port
             )
+            dataflow_endpoint_healthStatus = dataflow_endpoint["healthStatus"]
+            dataflow_endpoint_healthReasons = dataflow_endpoint["healthReasons"][0]
+
+            print(f"Name          : {dataflow_endpoint_name}")
+            print(f"Status        : {dataflow_endpoint_status}")
+            print(f"Health Status : {dataflow_endpoint_healthStatus}")
+            print(f"Health Reason : {dataflow_endpoint_healthReasons}")
+            print(f"Sec group     : {dataflow_endpoint_sg}")
+            print(f"Target:       : {dataflow_endpoint_IP}:{dataflow_endpoint_port}")
             print("")
         if "awsGroundStationAgentEndpoint" in dataflow_endpoint.keys():
             dataflow_endpoint_name = dataflow_endpoint["awsGroundStationAgentEndpoint"][
@@ -246,46 +545,31 @@ def view_mission_profile(gs_client, mission_profile_id, mission_profile_name):
             dataflow_endpoint_egress_socket_name = dataflow_endpoint[
                 "awsGroundStationAgentEndpoint"
             ]["egressAddress"]["socketAddress"]["name"]
-            dataflow_endpoint_egress_socket_port = str(
-                dataflow_endpoint["awsGroundStationAgentEndpoint"]["egressAddress"][
-                    "socketAddress"
-                ]["port"]
-            )
+            dataflow_endpoint_egress_socket_port = dataflow_endpoint[
+                "awsGroundStationAgentEndpoint"
+            ]["egressAddress"]["socketAddress"]["port"]
             dataflow_endpoint_ingress_socket_name = dataflow_endpoint[
                 "awsGroundStationAgentEndpoint"
             ]["ingressAddress"]["socketAddress"]["name"]
-            dataflow_endpoint_ingress_socket_port_max = str(
-                dataflow_endpoint["awsGroundStationAgentEndpoint"]["ingressAddress"][
-                    "socketAddress"
-                ]["portRange"]["maximum"]
-            )
-            dataflow_endpoint_ingress_socket_port_min = str(
-                dataflow_endpoint["awsGroundStationAgentEndpoint"]["ingressAddress"][
-                    "socketAddress"
-                ]["portRange"]["minimum"]
-            )
-            dataflow_endpoint_healthReasons = str(dataflow_endpoint["healthReasons"][0])
+            dataflow_endpoint_ingress_socket_port_max = dataflow_endpoint[
+                "awsGroundStationAgentEndpoint"
+            ]["ingressAddress"]["socketAddress"]["portRange"]["maximum"]
+            dataflow_endpoint_ingress_socket_port_min = dataflow_endpoint[
+                "awsGroundStationAgentEndpoint"
+            ]["ingressAddress"]["socketAddress"]["portRange"]["minimum"]
+            dataflow_endpoint_healthReasons = dataflow_endpoint["healthReasons"][0]
 
-            print("Name          : " + dataflow_endpoint_name)
-            print("Status        : " + dataflow_endpoint_agentStatus)
-            print("Health Status : " + dataflow_endpoint_auditResults)
-            print("Health Reason : " + dataflow_endpoint_healthReasons)
+            print(f"Name          : {dataflow_endpoint_name}")
+            print(f"Status        : {dataflow_endpoint_agentStatus}")
+            print(f"Health Status : {dataflow_endpoint_auditResults}")
+            print(f"Health Reason : {dataflow_endpoint_healthReasons}")
             print(
-                "Ingress       : "
-                + dataflow_endpoint_ingress_socket_name
-                + ":"
-                + dataflow_endpoint_ingress_socket_port_min
-                + "-"
-                + dataflow_endpoint_ingress_socket_port_max
+                f"Ingress       : {dataflow_endpoint_ingress_socket_name}:{dataflow_endpoint_ingress_socket_port_min}-{dataflow_endpoint_ingress_socket_port_max}"
             )
             print(
-                "Engress       : "
-                + dataflow_endpoint_egress_socket_name
-                + ":"
-                + dataflow_endpoint_egress_socket_port
+                f"Engress       : {dataflow_endpoint_egress_socket_name}:{dataflow_endpoint_egress_socket_port}"
             )
             print("")
-    quit()
 
 
 def update_mission_profile(gs_client, mission_profile_id):
@@ -316,39 +600,76 @@ def update_mission_profile(gs_client, mission_profile_id):
         }
     ]
 
-    update_answer = prompt(update_question)
-    update = update_answer["update"]
-
-    if update == "Mission profile name":
-        change_mission_profile(gs_client, mission_profile_id, "name")
-    elif update == "Uplink center frequency":
-        change_uplink_center_frequency(gs_client, mission_profile_id)
-    elif update == "Uplink polarization":
-        change_uplink_polarization(gs_client, mission_profile_id)
-    elif update == "Downlink polarization":
-        change_downlink_polarization(gs_client, mission_profile_id)
-    elif update == "DigIF Downlink center frequency":
-        change_downlink_center_frequency(gs_client, mission_profile_id)
-    elif update == "DigIF Downlink bandwidth":
-        change_downlink_bandwidth(gs_client, mission_profile_id)
-    elif update == "Minimum viable contact duration":
-        change_mission_profile(gs_client, mission_profile_id, "minimum contact")
-    elif update == "Contact prepass duration":
-        change_mission_profile(gs_client, mission_profile_id, "prepass")
-    elif update == "Contact postpass duration":
-        change_mission_profile(gs_client, mission_profile_id, "postpass")
-    elif update == "Antenna tracking":
-        change_tracking(gs_client, mission_profile_id)
-    elif update == "Uplink power":
-        change_uplink_power(gs_client, mission_profile_id)
-    elif update == "Other":
-        print(
-            "Updating other parameters is best done by redploying the CloudFormation template for your AWS Ground Station configuration."
-        )
-        print("Exiting to main menu.")
-        main()
-    elif update == "Quit":
-        quit()
+    next_question = [
+        {
+            "type": "list",
+            "name": "next",
+            "message": "What would you like to do next?",
+            "choices": [
+                "Update this mission profile again",
+                "Back to main menu",
+                "Quit",
+            ],
+        }
+    ]
+
+    while True:
+        update_answer = prompt(update_question)
+        update = update_answer["update"]
+
+        if update == "Mission profile name":
+            action = change_mission_profile(gs_client, mission_profile_id, "name")
+        elif update == "Uplink center frequency":
+            action = change_uplink_center_frequency(gs_client, mission_profile_id)
+        elif update == "Uplink polarization":
+            action = change_uplink_polarization(gs_client, mission_profile_id)
+        elif update == "Downlink polarization":
+            action = change_downlink_polarization(gs_client, mission_profile_id)
+        elif update == "DigIF Downlink center frequency":
+            action = change_downlink_center_frequency(gs_client, mission_profile_id)
+        elif update == "DigIF Downlink bandwidth":
+            action = change_downlink_bandwidth(gs_client, mission_profile_id)
+        elif update == "Minimum viable contact duration":
+            action = change_mission_profile(
+                gs_client, mission_profile_id, "minimum contact"
+            )
+        elif update == "Contact prepass duration":
+            action = change_mission_profile(gs_client, mission_profile_id, "prepass")
+        elif update == "Contact postpass duration":
+            action = change_mission_profile(gs_client, mission_profile_id, "postpass")
+        elif update == "Antenna tracking":
+            action = change_tracking(gs_client, mission_profile_id)
+        elif update == "Uplink power":
+            action = change_uplink_power(gs_client, mission_profile_id)
+        elif update == "Other":
+            print(
+                "Updating other parameters is best done by redploying the CloudFormation template for your AWS Ground Station configuration."
+            )
+            print("Exiting to main menu.")
+            return Action.DONE
+        elif update == "Quit":
+            return Action.QUIT
+
+        if action is Action.QUIT:
+            return Action.QUIT
+
+        # nothing was updated, so go straight back to the parameter choice
+        if action is Action.SKIPPED:
+            continue
+
+        next_answer = prompt(next_question)["next"]
+        if next_answer == "Back to main menu":
+            return Action.DONE
+        elif next_answer == "Quit":
+            return Action.QUIT
+
+
+# mission profile duration parameters and the mission profile field they update
+DURATION_PARAMETERS = {
+    "minimum contact": "minimumViableContactDurationSeconds",
+    "prepass": "contactPrePassDurationSeconds",
+    "postpass": "contactPostPassDurationSeconds",
+}
 
 
 def change_mission_profile(gs_client, mission_profile_id, parameter):
@@ -356,25 +677,11 @@ def change_mission_profile(gs_client, mission_profile_id, parameter):
         missionProfileId=mission_profile_id
     )
 
-    if (
-        parameter == "minimum contact"
-        or parameter == "prepass"
-        or parameter == "postpass"
-    ):
-        if parameter == "minimum contact":
-            value = updated_profile_data["minimumViableContactDurationSeconds"]
-        elif parameter == "prepass":
-            value = updated_profile_data["contactPrePassDurationSeconds"]
-        elif parameter == "postpass":
-            value = updated_profile_data["contactPostPassDurationSeconds"]
-
-        message = (
-            "The current value of "
-            + parameter
-            + " duration is "
-            + str(value)
-            + "s. \n Enter the new value in seconds:"
-        )
+    if parameter in DURATION_PARAMETERS:
+        duration_key = DURATION_PARAMETERS[parameter]
+        value = updated_profile_data[duration_key]
+
+        message = f"The current value of {parameter} duration is {value}s. \n Enter the new value in seconds:"
 
         duration_question = [
             {
@@ -388,12 +695,7 @@ def change_mission_profile(gs_client, mission_profile_id, parameter):
         duration_question_answer = prompt(duration_question)
         duration = int(duration_question_answer["duration"])
 
-        if parameter == "minimum contact":
-            updated_profile_data["minimumViableContactDurationSeconds"] = duration
-        elif parameter == "prepass":
-            updated_profile_data["contactPrePassDurationSeconds"] = duration
-        elif parameter == "postpass":
-            updated_profile_data["contactPostPassDurationSeconds"] = duration
+        updated_profile_data[duration_key] = duration
 
         # Find dataflow endpoint group associated with this mission profile
         # Needed to update DFEG pre/post pass durations when an UpdateDataflowEndpointGroup API is made available
@@ -402,59 +704,20 @@ def change_mission_profile(gs_client, mission_profile_id, parameter):
             missionProfileId=mission_profile_id
         )
 
-        endpoint_name_list = []
-
-        for config_pair in profile_data["dataflowEdges"]:
-            for config in config_pair:
-                config_id = config.split("/")[2]
-                config_type = config.split("/")[1]
-
-                if config_type == "dataflow-endpoint":
-                    endpoint_name = gs_client.get_config(
-                        configId=config_id, configType=config_type
-                    )["configData"]["dataflowEndpointConfig"]["dataflowEndpointName"]
-                    endpoint_name_list.append(endpoint_name)
-
-        dataflow_endpoint_group_list = gs_client.list_dataflow_endpoint_groups()
-
-        selected_dataflow_endpoint_group_id = ""
+        endpoint_config_ids = set(
+            find_config_ids(profile_data["dataflowEdges"], "dataflow-endpoint")
+        )
+        endpoint_name_set = {
+            config["configData"]["dataflowEndpointConfig"]["dataflowEndpointName"]
+            for config in get_configs(
+                gs_client, endpoint_config_ids, "dataflow-endpoint"
+            )
+        }
 
         # select the DFEG associated with the mission profile
-        for dataflow_endpoint_group in dataflow_endpoint_group_list[
-            "dataflowEndpointGroupList"
-        ]:
-            dataflow_endpoint_group_id = dataflow_endpoint_group[
-                "dataflowEndpointGroupId"
-            ]
-            # print("**********************")
-            # print(gs_client.get_dataflow_endpoint_group(dataflowEndpointGroupId=dataflow_endpoint_group_id))
-            # print("**********************")
-            for dataflow_endpoint in gs_client.get_dataflow_endpoint_group(
-                dataflowEndpointGroupId=dataflow_endpoint_group_id
-            )["endpointsDetails"]:
-                if dataflow_endpoint:
-                    if "endpoint" in dataflow_endpoint.keys():
-                        endpoint_type = "endpoint"
-                        dataflow_endpoint_name = dataflow_endpoint[endpoint_type][
-                            "name"
-                        ]
-                        if dataflow_endpoint_name in endpoint_name_list:
-                            selected_dataflow_endpoint_group_id = (
-                                dataflow_endpoint_group_id
-                            )
-                            break
-                    if "awsGroundStationAgentEndpoint" in dataflow_endpoint.keys():
-                        endpoint_type = "awsGroundStationAgentEndpoint"
-                        dataflow_endpoint_name = dataflow_endpoint[endpoint_type][
-                            "name"
-                        ]
-                        if dataflow_endpoint_name in endpoint_name_list:
-                            selected_dataflow_endpoint_group_id = (
-                                dataflow_endpoint_group_id
-                            )
-                            break
-
-        dataflow_endpoint_group_id = selected_dataflow_endpoint_group_id
+        dataflow_endpoint_group_id, _ = find_dataflow_endpoint_group(
+            gs_client, endpoint_name_set
+        )
         # if not dataflow_endpoint_group_id:
         #     print(
         #         "There are no dataflow endpoints in this mission profile that are part of a dataflow endpoint group."
@@ -466,9 +729,7 @@ def change_mission_profile(gs_client, mission_profile_id, parameter):
             {
                 "type": "input",
                 "name": "name",
-                "message": "Current mission profile name: "
-                + str(updated_profile_data["name"])
-                + " \n   Enter a new name:",
+                "message": f"Current mission profile name: {updated_profile_data['name']} \n   Enter a new name:",
                 "validate": NameValidator,
             }
         ]
@@ -497,30 +758,24 @@ def change_mission_profile(gs_client, mission_profile_id, parameter):
     except Exception as e:
         print(e)
     else:
-        if (
-            parameter == "minimum contact"
-            or parameter == "prepass"
-            or parameter == "postpass"
-        ):
+        if parameter in DURATION_PARAMETERS:
             print(
-                "Update complete. The "
-                + parameter
-                + " duration has been set to: "
-                + str(duration)
-                + "s."
+                f"Update complete. The {parameter} duration has been set to: {duration}s."
             )
         if parameter == "name":
             print(
-                "Update complete. The mission profile name has been changed to: " + name
+                f"Update complete. The mission profile name has been changed to: {name}"
             )
 
-    main()
+    return Action.DONE
 
 
 def change_tracking(gs_client, mission_profile_id):
+    # After a view of the same mission profile these reads are served by the
+    # client's cache
     profile_data = gs_client.get_mission_profile(missionProfileId=mission_profile_id)
 
-    tracking_config_id = profile_data["trackingConfigArn"].split("/")[2]
+    tracking_config_id, _ = parse_config_arn(profile_data["trackingConfigArn"])
     tracking_config = gs_client.get_config(
         configId=tracking_config_id, configType="tracking"
     )
@@ -529,9 +784,7 @@ def change_tracking(gs_client, mission_profile_id):
         {
             "type": "list",
             "name": "tracking",
-            "message": "Currently autotrack is: "
-            + str(tracking_config["configData"]["trackingConfig"]["autotrack"])
-            + " What new value would you like?",
+            "message": f"Currently autotrack is: {tracking_config['configData']['trackingConfig']['autotrack']} What new value would you like?",
             "choices": [
                 "PREFERRED",
                 "REMOVED",
@@ -556,47 +809,38 @@ def change_tracking(gs_client, mission_profile_id):
         print(e)
     else:
         print(
-            "Update complete. The antenna tracking config has been set to: " + tracking
+            f"Update complete. The antenna tracking config has been set to: {tracking}"
         )
 
-    main()
+    return Action.DONE
 
 
 def change_uplink_power(gs_client, mission_profile_id):
-    uplink_conflig_id = ""
-
     profile_data = gs_client.get_mission_profile(missionProfileId=mission_profile_id)
 
-    for config_pair in profile_data["dataflowEdges"]:
-        for config in config_pair:
-            config_id = config.split("/")[2]
-            config_type = config.split("/")[1]
+    uplink_config_id = find_config_id(profile_data["dataflowEdges"], "antenna-uplink")
 
-            if config_type == "antenna-uplink":
-                uplink_conflig_id = config_id
-                break
-
-    if not uplink_conflig_id:
+    if not uplink_config_id:
         print(
-            "There is no antenna uplink config in this mission profile. Exiting to main menu."
+            "There is no antenna uplink config in this mission profile. Choose another parameter to update."
         )
-        main()
+        return Action.SKIPPED
 
     uplink_config = gs_client.get_config(
-        configId=uplink_conflig_id, configType="antenna-uplink"
+        configId=uplink_config_id, configType="antenna-uplink"
     )
 
-    current_power = uplink_config["configData"]["antennaUplinkConfig"]["targetEirp"][
-        "value"
-    ]
+    antenna_uplink_config = uplink_config["configData"]["antennaUplinkConfig"]
+    spectrum_config = antenna_uplink_config["spectrumConfig"]
+    center_frequency_config = spectrum_config["centerFrequency"]
+
+    current_power = antenna_uplink_config["targetEirp"]["value"]
 
     power_question = [
         {
             "type": "input",
             "name": "power",
-            "message": "The current EIRP is "
-            + str(current_power)
-            + "dBW. \n  Enter the desired EIRP. Valid values: 20-50 dBW",
+            "message": f"The current EIRP is {current_power}dBW. \n  Enter the desired EIRP. Valid values: 20-50 dBW",
             "validate": PowerValidator,
         }
     ]
@@ -610,21 +854,13 @@ def change_uplink_power(gs_client, mission_profile_id):
                 "antennaUplinkConfig": {
                     "spectrumConfig": {
                         "centerFrequency": {
-                            "units": uplink_config["configData"]["antennaUplinkConfig"][
-                                "spectrumConfig"
-                            ]["centerFrequency"]["units"],
-                            "value": uplink_config["configData"]["antennaUplinkConfig"][
-                                "spectrumConfig"
-                            ]["centerFrequency"]["value"],
+                            "units": center_frequency_config["units"],
+                            "value": center_frequency_config["value"],
                         },
-                        "polarization": uplink_config["configData"][
-                            "antennaUplinkConfig"
-                        ]["spectrumConfig"]["polarization"],
+                        "polarization": spectrum_config["polarization"],
                     },
                     "targetEirp": {"units": "dBW", "value": power},
-                    "transmitDisabled": uplink_config["configData"][
-                        "antennaUplinkConfig"
-                    ]["transmitDisabled"],
+                    "transmitDisabled": antenna_uplink_config["transmitDisabled"],
                 },
             },
             configId=uplink_config["configId"],
@@ -634,53 +870,38 @@ def change_uplink_power(gs_client, mission_profile_id):
     except Exception as e:
         print(e)
     else:
-        print(
-            "Update complete. The uplink EIRP has been set to: " + str(power) + "dBW."
-        )
+        print(f"Update complete. The uplink EIRP has been set to: {power}dBW.")
 
-    main()
+    return Action.DONE
 
 
 def change_uplink_center_frequency(gs_client, mission_profile_id):
-    uplink_conflig_id = ""
-
     profile_data = gs_client.get_mission_profile(missionProfileId=mission_profile_id)
 
-    for config_pair in profile_data["dataflowEdges"]:
-        for config in config_pair:
-            config_id = config.split("/")[2]
-            config_type = config.split("/")[1]
-
-            if config_type == "antenna-uplink":
-                uplink_conflig_id = config_id
-                break
+    uplink_config_id = find_config_id(profile_data["dataflowEdges"], "antenna-uplink")
 
-    if not uplink_conflig_id:
+    if not uplink_config_id:
         print(
-            "There is no antenna uplink config in this mission profile. Exiting to main menu."
+            "There is no antenna uplink config in this mission profile. Choose another parameter to update."
         )
-        main()
+        return Action.SKIPPED
 
     uplink_config = gs_client.get_config(
-        configId=uplink_conflig_id, configType="antenna-uplink"
+        configId=uplink_config_id, configType="antenna-uplink"
     )
 
-    current_center_frequency = uplink_config["configData"]["antennaUplinkConfig"][
-        "spectrumConfig"
-    ]["centerFrequency"]["value"]
-    center_frequency_unit = uplink_config["configData"]["antennaUplinkConfig"][
-        "spectrumConfig"
-    ]["centerFrequency"]["units"]
+    antenna_uplink_config = uplink_config["configData"]["antennaUplinkConfig"]
+    spectrum_config = antenna_uplink_config["spectrumConfig"]
+    target_eirp = antenna_uplink_config["targetEirp"]
+
+    current_center_frequency = spectrum_config["centerFrequency"]["value"]
+    center_frequency_unit = spectrum_config["centerFrequency"]["units"]
 
     center_frequency_question = [
         {
             "type": "input",
             "name": "center_frequency",
-            "message": "The current uplink center frequency is "
-            + str(current_center_frequency)
-            + " "
-            + str(center_frequency_unit)
-            + "\n  Enter the desired uplink center frequency in MHz. You must be licenced for this frequency.",
+            "message": f"The current uplink center frequency is {current_center_frequency} {center_frequency_unit}\n  Enter the desired uplink center frequency in MHz. You must be licenced for this frequency.",
             "validate": UplinkFrequencyValidator,
         }
     ]
@@ -697,21 +918,13 @@ def change_uplink_center_frequency(gs_client, mission_profile_id):
                             "units": "MHz",
                             "value": center_frequency,
                         },
-                        "polarization": uplink_config["configData"][
-                            "antennaUplinkConfig"
-                        ]["spectrumConfig"]["polarization"],
+                        "polarization": spectrum_config["polarization"],
                     },
                     "targetEirp": {
-                        "units": uplink_config["configData"]["antennaUplinkConfig"][
-                            "targetEirp"
-                        ]["units"],
-                        "value": uplink_config["configData"]["antennaUplinkConfig"][
-                            "targetEirp"
-                        ]["value"],
+                        "units": target_eirp["units"],
+                        "value": target_eirp["value"],
                     },
-                    "transmitDisabled": uplink_config["configData"][
-                        "antennaUplinkConfig"
-                    ]["transmitDisabled"],
+                    "transmitDisabled": antenna_uplink_config["transmitDisabled"],
                 },
             },
             configId=uplink_config["configId"],
@@ -722,50 +935,33 @@ def change_uplink_center_frequency(gs_client, mission_profile_id):
         print(e)
     else:
         print(
-            "Update complete. The uplink center frequency has been set to: "
-            + str(center_frequency)
-            + " MHz."
+            f"Update complete. The uplink center frequency has been set to: {center_frequency} MHz."
         )
 
-    main()
+    return Action.DONE
 
 
 def change_downlink_center_frequency(gs_client, mission_profile_id):
-    downlink_config_IDs = []
-    downlink_config_id = ""
-
     profile_data = gs_client.get_mission_profile(missionProfileId=mission_profile_id)
 
-    for config_pair in profile_data["dataflowEdges"]:
-        for config in config_pair:
-            config_id = config.split("/")[2]
-            config_type = config.split("/")[1]
-
-            if config_type == "antenna-downlink":
-                downlink_config_IDs.append(config_id)
+    downlink_config_IDs = list(
+        find_config_ids(profile_data["dataflowEdges"], "antenna-downlink")
+    )
 
     if not downlink_config_IDs:
         print(
-            "There is no antenna digIf downlink config in this mission profile. Exiting to main menu."
+            "There is no antenna digIf downlink config in this mission profile. Choose another parameter to update."
         )
-        main()
-
-    center_frequencies = []
-
-    for config_id in downlink_config_IDs:
-        downlink_config = gs_client.get_config(
-            configId=config_id, configType="antenna-downlink"
+        return Action.SKIPPED
+
+    center_frequencies = [
+        downlink_config["configData"]["antennaDownlinkConfig"]["spectrumConfig"][
+            "centerFrequency"
+        ]["value"]
+        for downlink_config in get_configs(
+            gs_client, downlink_config_IDs, "antenna-downlink"
         )
-
-        current_center_frequency = downlink_config["configData"][
-            "antennaDownlinkConfig"
-        ]["spectrumConfig"]["centerFrequency"]["value"]
-
-        center_frequencies.append(current_center_frequency)
-
-        center_frequency_unit = downlink_config["configData"]["antennaDownlinkConfig"][
-            "spectrumConfig"
-        ]["centerFrequency"]["units"]
+    ]
 
     if len(center_frequencies) > 1:
         if center_frequencies[0] > center_frequencies[1]:
@@ -799,22 +995,19 @@ def change_downlink_center_frequency(gs_client, mission_profile_id):
         configId=downlink_config_id, configType="antenna-downlink"
     )
 
-    current_center_frequency = downlink_config["configData"]["antennaDownlinkConfig"][
-        "spectrumConfig"
-    ]["centerFrequency"]["value"]
-    center_frequency_unit = downlink_config["configData"]["antennaDownlinkConfig"][
+    spectrum_config = downlink_config["configData"]["antennaDownlinkConfig"][
         "spectrumConfig"
-    ]["centerFrequency"]["units"]
+    ]
+    bandwidth_config = spectrum_config["bandwidth"]
+
+    current_center_frequency = spectrum_config["centerFrequency"]["value"]
+    center_frequency_unit = spectrum_config["centerFrequency"]["units"]
 
     center_frequency_question = [
         {
             "type": "input",
             "name": "center_frequency",
-            "message": "The current downlink center frequency is "
-            + str(current_center_frequency)
-            + " "
-            + str(center_frequency_unit)
-            + "\n  Enter the desired downlink center frequency in MHz. You must be licenced for this frequency.",
+            "message": f"The current downlink center frequency is {current_center_frequency} {center_frequency_unit}\n  Enter the desired downlink center frequency in MHz. You must be licenced for this frequency.",
             "validate": DownlinkFrequencyValidator,
         }
     ]
@@ -832,16 +1025,10 @@ def change_downlink_center_frequency(gs_client, mission_profile_id):
                             "value": center_frequency,
                         },
                         "bandwidth": {
-                            "units": downlink_config["configData"][
-                                "antennaDownlinkConfig"
-                            ]["spectrumConfig"]["bandwidth"]["units"],
-                            "value": downlink_config["configData"][
-                                "antennaDownlinkConfig"
-                            ]["spectrumConfig"]["bandwidth"]["value"],
+                            "units": bandwidth_config["units"],
+                            "value": bandwidth_config["value"],
                         },
-                        "polarization": downlink_config["configData"][
-                            "antennaDownlinkConfig"
-                        ]["spectrumConfig"]["polarization"],
+                        "polarization": spectrum_config["polarization"],
                     }
                 },
             },
@@ -853,36 +1040,25 @@ def change_downlink_center_frequency(gs_client, mission_profile_id):
         print(e)
     else:
         print(
-            "Update complete. The downlink center frequency has been set to: "
-            + str(center_frequency)
-            + " MHz."
+            f"Update complete. The downlink center frequency has been set to: {center_frequency} MHz."
         )
 
-    main()
+    return Action.DONE
 
 
 def refresh_uplink_echo(gs_client, mission_profile_id):
-    uplink_echo_conflig_id = ""
-
     profile_data = gs_client.get_mission_profile(missionProfileId=mission_profile_id)
 
-    for config_pair in profile_data["dataflowEdges"]:
-        for config in config_pair:
-            config_id = config.split("/")[2]
-            config_type = config.split("/")[1]
-
-            if config_type == "uplink-echo":
-                uplink_echo_conflig_id = config_id
-                break
+    uplink_echo_config_id = find_config_id(profile_data["dataflowEdges"], "uplink-echo")
 
-    if not uplink_echo_conflig_id:
+    if not uplink_echo_config_id:
         print(
-            "There is no antenna uplink echo config in this mission profile. Exiting to main menu."
+            "There is no antenna uplink echo config in this mission profile to refresh."
         )
-        main()
+        return
 
     uplink_echo_config = gs_client.get_config(
-        configId=uplink_echo_conflig_id, configType="uplink-echo"
+        configId=uplink_echo_config_id, configType="uplink-echo"
     )
 
     try:
@@ -904,44 +1080,33 @@ def refresh_uplink_echo(gs_client, mission_profile_id):
     except Exception as e:
         print(e)
 
-    main()
-
 
 def change_uplink_polarization(gs_client, mission_profile_id):
-    uplink_conflig_id = ""
-
     profile_data = gs_client.get_mission_profile(missionProfileId=mission_profile_id)
 
-    for config_pair in profile_data["dataflowEdges"]:
-        for config in config_pair:
-            config_id = config.split("/")[2]
-            config_type = config.split("/")[1]
-
-            if config_type == "antenna-uplink":
-                uplink_conflig_id = config_id
-                break
+    uplink_config_id = find_config_id(profile_data["dataflowEdges"], "antenna-uplink")
 
-    if not uplink_conflig_id:
+    if not uplink_config_id:
         print(
-            "There is no antenna uplink config in this mission profile. Exiting to main menu."
+            "There is no antenna uplink config in this mission profile. Choose another parameter to update."
         )
-        main()
+        return Action.SKIPPED
 
     uplink_config = gs_client.get_config(
-        configId=uplink_conflig_id, configType="antenna-uplink"
+        configId=uplink_config_id, configType="antenna-uplink"
     )
 
-    current_polarization = uplink_config["configData"]["antennaUplinkConfig"][
-        "spectrumConfig"
-    ]["polarization"]
+    antenna_uplink_config = uplink_config["configData"]["antennaUplinkConfig"]
+    spectrum_config = antenna_uplink_config["spectrumConfig"]
+    target_eirp = antenna_uplink_config["targetEirp"]
+
+    current_polarization = spectrum_config["polarization"]
 
     polarization_question = [
         {
             "type": "list",
             "name": "polarization",
-            "message": "The current uplink polarization is "
-            + str(current_polarization)
-            + "\n  Enter the desired uplink polarization.",
+            "message": f"The current uplink polarization is {current_polarization}\n  Enter the desired uplink polarization.",
             "choices": ["RIGHT_HAND", "LEFT_HAND"],
         }
     ]
@@ -956,23 +1121,15 @@ def change_uplink_polarization(gs_client, mission_profile_id):
                     "spectrumConfig": {
                         "centerFrequency": {
                             "units": "MHz",
-                            "value": uplink_config["configData"]["antennaUplinkConfig"][
-                                "spectrumConfig"
-                            ]["centerFrequency"]["value"],
+                            "value": spectrum_config["centerFrequency"]["value"],
                         },
                         "polarization": polarization,
                     },
                     "targetEirp": {
-                        "units": uplink_config["configData"]["antennaUplinkConfig"][
-                            "targetEirp"
-                        ]["units"],
-                        "value": uplink_config["configData"]["antennaUplinkConfig"][
-                            "targetEirp"
-                        ]["value"],
+                        "units": target_eirp["units"],
+                        "value": target_eirp["value"],
                     },
-                    "transmitDisabled": uplink_config["configData"][
-                        "antennaUplinkConfig"
-                    ]["transmitDisabled"],
+                    "transmitDisabled": antenna_uplink_config["transmitDisabled"],
                 },
             },
             configId=uplink_config["configId"],
@@ -983,51 +1140,35 @@ def change_uplink_polarization(gs_client, mission_profile_id):
         print(e)
     else:
         print(
-            "Update complete. The uplink polarization has been set to: "
-            + str(polarization)
+            f"Update complete. The uplink polarization has been set to: {polarization}"
         )
 
     refresh_uplink_echo(gs_client, mission_profile_id)
 
-    main()
+    return Action.DONE
 
 
 def change_downlink_polarization(gs_client, mission_profile_id):
-    downlink_config_IDs = []
-    downlink_config_id = ""
-
     profile_data = gs_client.get_mission_profile(missionProfileId=mission_profile_id)
 
-    for config_pair in profile_data["dataflowEdges"]:
-        for config in config_pair:
-            config_id = config.split("/")[2]
-            config_type = config.split("/")[1]
-
-            if config_type == "antenna-downlink":
-                downlink_config_IDs.append(config_id)
+    downlink_config_IDs = list(
+        find_config_ids(profile_data["dataflowEdges"], "antenna-downlink")
+    )
 
     if not downlink_config_IDs:
         print(
-            "There is no antenna downlink config in this mission profile. Exiting to main menu."
+            "There is no antenna downlink config in this mission profile. Choose another parameter to update."
         )
-        main()
-
-    center_frequencies = []
-
-    for config_id in downlink_config_IDs:
-        downlink_config = gs_client.get_config(
-            configId=config_id, configType="antenna-downlink"
+        return Action.SKIPPED
+
+    center_frequencies = [
+        downlink_config["configData"]["antennaDownlinkConfig"]["spectrumConfig"][
+            "centerFrequency"
+        ]["value"]
+        for downlink_config in get_configs(
+            gs_client, downlink_config_IDs, "antenna-downlink"
         )
-
-        current_center_frequency = downlink_config["configData"][
-            "antennaDownlinkConfig"
-        ]["spectrumConfig"]["centerFrequency"]["value"]
-
-        center_frequencies.append(current_center_frequency)
-
-        center_frequency_unit = downlink_config["configData"]["antennaDownlinkConfig"][
-            "spectrumConfig"
-        ]["centerFrequency"]["units"]
+    ]
 
     if len(center_frequencies) > 1:
         if center_frequencies[0] > center_frequencies[1]:
@@ -1061,17 +1202,18 @@ def change_downlink_polarization(gs_client, mission_profile_id):
         configId=downlink_config_id, configType="antenna-downlink"
     )
 
-    current_polarization = downlink_config["configData"]["antennaDownlinkConfig"][
+    spectrum_config = downlink_config["configData"]["antennaDownlinkConfig"][
         "spectrumConfig"
-    ]["polarization"]
+    ]
+    bandwidth_config = spectrum_config["bandwidth"]
+
+    current_polarization = spectrum_config["polarization"]
 
     polarization_question = [
         {
             "type": "list",
             "name": "polarization",
-            "message": "The current downlink polarization is "
-            + str(current_polarization)
-            + "\n  Enter the desired downlink polarization.",
+            "message": f"The current downlink polarization is {current_polarization}\n  Enter the desired downlink polarization.",
             "choices": ["RIGHT_HAND", "LEFT_HAND"],
         }
     ]
@@ -1086,17 +1228,11 @@ def change_downlink_polarization(gs_client, mission_profile_id):
                     "spectrumConfig": {
                         "centerFrequency": {
                             "units": "MHz",
-                            "value": downlink_config["configData"][
-                                "antennaDownlinkConfig"
-                            ]["spectrumConfig"]["centerFrequency"]["value"],
+                            "value": spectrum_config["centerFrequency"]["value"],
                         },
                         "bandwidth": {
-                            "units": downlink_config["configData"][
-                                "antennaDownlinkConfig"
-                            ]["spectrumConfig"]["bandwidth"]["units"],
-                            "value": downlink_config["configData"][
-                                "antennaDownlinkConfig"
-                            ]["spectrumConfig"]["bandwidth"]["value"],
+                            "units": bandwidth_config["units"],
+                            "value": bandwidth_config["value"],
                         },
                         "polarization": polarization,
                     },
@@ -1110,49 +1246,33 @@ def change_downlink_polarization(gs_client, mission_profile_id):
         print(e)
     else:
         print(
-            "Update complete. The downlink polarization has been set to: "
-            + str(polarization)
+            f"Update complete. The downlink polarization has been set to: {polarization}"
         )
 
-    main()
+    return Action.DONE
 
 
 def change_downlink_bandwidth(gs_client, mission_profile_id):
-    downlink_config_IDs = []
-    downlink_config_id = ""
-
     profile_data = gs_client.get_mission_profile(missionProfileId=mission_profile_id)
 
-    for config_pair in profile_data["dataflowEdges"]:
-        for config in config_pair:
-            config_id = config.split("/")[2]
-            config_type = config.split("/")[1]
-
-            if config_type == "antenna-downlink":
-                downlink_config_IDs.append(config_id)
+    downlink_config_IDs = list(
+        find_config_ids(profile_data["dataflowEdges"], "antenna-downlink")
+    )
 
     if not downlink_config_IDs:
         print(
-            "There is no antenna digIf downlink config in this mission profile. Exiting to main menu."
+            "There is no antenna digIf downlink config in this mission profile. Choose another parameter to update."
         )
-        main()
-
-    center_frequencies = []
-
-    for config_id in downlink_config_IDs:
-        downlink_config = gs_client.get_config(
-            configId=config_id, configType="antenna-downlink"
+        return Action.SKIPPED
+
+    center_frequencies = [
+        downlink_config["configData"]["antennaDownlinkConfig"]["spectrumConfig"][
+            "centerFrequency"
+        ]["value"]
+        for downlink_config in get_configs(
+            gs_client, downlink_config_IDs, "antenna-downlink"
         )
-
-        current_center_frequency = downlink_config["configData"][
-            "antennaDownlinkConfig"
-        ]["spectrumConfig"]["centerFrequency"]["value"]
-
-        center_frequencies.append(current_center_frequency)
-
-        center_frequency_unit = downlink_config["configData"]["antennaDownlinkConfig"][
-            "spectrumConfig"
-        ]["centerFrequency"]["units"]
+    ]
 
     if len(center_frequencies) > 1:
         if center_frequencies[0] > center_frequencies[1]:
@@ -1186,22 +1306,19 @@ def change_downlink_bandwidth(gs_client, mission_profile_id):
         configId=downlink_config_id, configType="antenna-downlink"
     )
 
-    current_bandwidth = downlink_config["configData"]["antennaDownlinkConfig"][
-        "spectrumConfig"
-    ]["bandwidth"]["value"]
-    bandwidth_unit = downlink_config["configData"]["antennaDownlinkConfig"][
+    spectrum_config = downlink_config["configData"]["antennaDownlinkConfig"][
         "spectrumConfig"
-    ]["bandwidth"]["units"]
+    ]
+    center_frequency_config = spectrum_config["centerFrequency"]
+
+    current_bandwidth = spectrum_config["bandwidth"]["value"]
+    bandwidth_unit = spectrum_config["bandwidth"]["units"]
 
     bandwidth_question = [
         {
             "type": "input",
             "name": "bandwidth",
-            "message": "The current downlink bandwidth is "
-            + str(current_bandwidth)
-            + " "
-            + str(bandwidth_unit)
-            + "\n  Enter the desired downlink bandwidth in kHz. You must be licenced for this bandwidth.",
+            "message": f"The current downlink bandwidth is {current_bandwidth} {bandwidth_unit}\n  Enter the desired downlink bandwidth in kHz. You must be licenced for this bandwidth.",
             "validate": DownlinkBandwidthValidator,
         }
     ]
@@ -1215,20 +1332,14 @@ def change_downlink_bandwidth(gs_client, mission_profile_id):
                 "antennaDownlinkConfig": {
                     "spectrumConfig": {
                         "centerFrequency": {
-                            "units": downlink_config["configData"][
-                                "antennaDownlinkConfig"
-                            ]["spectrumConfig"]["centerFrequency"]["units"],
-                            "value": downlink_config["configData"][
-                                "antennaDownlinkConfig"
-                            ]["spectrumConfig"]["centerFrequency"]["value"],
+                            "units": center_frequency_config["units"],
+                            "value": center_frequency_config["value"],
                         },
                         "bandwidth": {
                             "units": "kHz",
                             "value": bandwidth,
                         },
-                        "polarization": downlink_config["configData"][
-                            "antennaDownlinkConfig"
-                        ]["spectrumConfig"]["polarization"],
+                        "polarization": spectrum_config["polarization"],
                     }
                 },
             },
@@ -1240,12 +1351,10 @@ def change_downlink_bandwidth(gs_client, mission_profile_id):
         print(e)
     else:
         print(
-            "Update complete. The downlink bandwidth frequency has been set to: "
-            + str(bandwidth)
-            + " kHz."
+            f"Update complete. The downlink bandwidth frequency has been set to: {bandwidth} kHz."
         )
 
-    main()
+    return Action.DONE
 
 
 def get_service_usage(gs_client):
@@ -1277,32 +1386,32 @@ def get_service_usage(gs_client):
     year_question_answer = prompt(year_question)
     target_year = int(year_question_answer["year"])
 
-    iam = boto3.resource("iam")
-    account_id = iam.CurrentUser().arn.split(":")[4]
+    account_id = get_account_id()
 
     usage = gs_client.get_minute_usage(month=target_month, year=target_year)
 
     print(
-        "AWS Ground Station reserved minute usage for AWS account ID "
-        + account_id
-        + " during "
-        + str(target_month)
-        + "/"
-        + str(target_year)
-        + ":"
+        f"AWS Ground Station reserved minute usage for AWS account ID {account_id} during {target_month}/{target_year}:"
     )
-    print("Reserved minutes customer : " + str(usage["isReservedMinutesCustomer"]))
-    print("Completed minutes         : " + str(usage["totalScheduledMinutes"]))
-    print("Scheduled minutes         : " + str(usage["upcomingMinutesScheduled"]))
-    print("Total reserved minutes    : " + str(usage["totalReservedMinuteAllocation"]))
-    print("Remaining reserved minutes: " + str(usage["estimatedMinutesRemaining"]))
+    print(f"Reserved minutes customer : {usage['isReservedMinutesCustomer']}")
+    print(f"Completed minutes         : {usage['totalScheduledMinutes']}")
+    print(f"Scheduled minutes         : {usage['upcomingMinutesScheduled']}")
+    print(f"Total reserved minutes    : {usage['totalReservedMinuteAllocation']}")
+    print(f"Remaining reserved minutes: {usage['estimatedMinutesRemaining']}")
 
-    main()
+
+def parse_number(text, number_type):
+    try:
+        return number_type(text)
+    except ValueError:
+        return None
 
 
 class YearValidator(Validator):
+    pattern = re.compile(r"20(1[89]|2[0-7])")
+
     def validate(self, document):
-        ok = regex.match("20(1[89]|2[0-7])", document.text)
+        ok = self.pattern.fullmatch(document.text)
         if not ok:
             raise ValidationError(
                 message="Please enter a valid year [YYYY] between 2018 and 2027",
@@ -1311,8 +1420,10 @@ class YearValidator(Validator):
 
 
 class MonthValidator(Validator):
+    pattern = re.compile(r"[1-9]|10|11|12")
+
     def validate(self, document):
-        ok = regex.match("^([1-9]|10|11|12)$", document.text)
+        ok = self.pattern.fullmatch(document.text)
         if not ok:
             raise ValidationError(
                 message="Please enter a valid month [1-12]",
@@ -1322,9 +1433,8 @@ class MonthValidator(Validator):
 
 class DurationValidator(Validator):
     def validate(self, document):
-        ok = regex.match(
-            "^(12[0-9]|1[3-9][0-9]|2[0-9]{2}|3[0-9]{2}|4[0-7][0-9]|480)$", document.text
-        )
+        value = parse_number(document.text, int)
+        ok = value is not None and 120 <= value <= 480
         if not ok:
             raise ValidationError(
                 message="Please enter a valid duration value in seconds [120-480]",
@@ -1333,8 +1443,10 @@ class DurationValidator(Validator):
 
 
 class NameValidator(Validator):
+    pattern = re.compile(r"[a-zA-Z0-9-\s\d]*")
+
     def validate(self, document):
-        ok = regex.match("^[a-zA-Z0-9-\s\d]*$", document.text)
+        ok = self.pattern.fullmatch(document.text)
         if not ok:
             raise ValidationError(
                 message="Please enter a valid name. Allowed characters: a-z, A-Z, 0-9, -, and space",
@@ -1344,7 +1456,8 @@ class NameValidator(Validator):
 
 class PowerValidator(Validator):
     def validate(self, document):
-        ok = regex.match("^[2-4][0-9]?$|^50$", document.text)
+        value = parse_number(document.text, float)
+        ok = value is not None and 20 <= value <= 50
         if not ok:
             raise ValidationError(
                 message="Please enter a valid EIRP dBw value [20-50]",
@@ -1354,7 +1467,8 @@ class PowerValidator(Validator):
 
 class UplinkFrequencyValidator(Validator):
     def validate(self, document):
-        ok = regex.match("^202[5-9]|20[3-9][0-9]|21[0-1][0-9]?$|^2120$", document.text)
+        value = parse_number(document.text, float)
+        ok = value is not None and 2025 <= value <= 2120
         if not ok:
             raise ValidationError(
                 message="This uplink center frequency is not supported. Valid values are between 2025 to 2120 MHz, for which you are licenced.",
@@ -1364,10 +1478,8 @@ class UplinkFrequencyValidator(Validator):
 
 class DownlinkFrequencyValidator(Validator):
     def validate(self, document):
-        ok = regex.match(
-            "^22[0-9][0-9]?$|^2300|77[5-9][0-9]|7[8-9][0-9][0-9]|8[0-3][0-9][0-9]|^8400$",
-            document.text,
-        )
+        value = parse_number(document.text, float)
+        ok = value is not None and (2200 <= value <= 2300 or 7750 <= value <= 8400)
         if not ok:
             raise ValidationError(
                 message="This downlink center frequency is not supported. Valid values are between 2200 to 2300 MHz and 7750 to 8400 MHz, for which you are licenced.",
@@ -1377,10 +1489,8 @@ class DownlinkFrequencyValidator(Validator):
 
 class DownlinkBandwidthValidator(Validator):
     def validate(self, document):
-        ok = regex.match(
-            "^[1-9][0-9]$|^[1-9][0-9][0-9]?$|^[1-9][0-9][0-9][0-9]?$|^[1-3][0-9][0-9][0-9][0-9]?$|^40000$",
-            document.text,
-        )
+        value = parse_number(document.text, float)
+        ok = value is not None and 10 <= value <= 40000
         if not ok:
             raise ValidationError(
                 message="This downlink bandwidth is not supported. Valid values are between 10 and 40000 kHz, for which you are licenced.",
@@ -1388,98 +1498,204 @@ class DownlinkBandwidthValidator(Validator):
             )
 
 
+# Region ID to the label shown in the region menu
+REGIONS = {
+    "us-east-1": "N. Virginia",
+    "us-east-2": "Ohio",
+    "us-west-2": "Oregon",
+    "af-south-1": "Cape Town",
+    "ap-northeast-2": "Seoul",
+    "ap-southeast-2": "Sydney",
+    "eu-central-1": "Frankfurt",
+    "eu-west-1": "Ireland",
+    "eu-north-1": "Stockholm",
+    "me-south-1": "Bahrain",
+    "sa-east-1": "Sao Paulo",
+    "ap-southeast-1": "Singapore",
+}
+
+
 def main():
-    task_question = [
-        {
-            "type": "list",
-            "name": "task",
-            "message": "What would you like to do?",
-            "choices": [
-                "View mission profile",
-                "Update mission profile",
-                "View reserved minute usage",
-                "Quit",
-            ],
-        }
-    ]
+    session = SessionState()
+
+    # boto3 is imported and the service models are loaded in the background
+    # while the first menu is on screen
+    service_models = run_in_background(load_service_models)
+
+    while True:
+        task_choices = [
+            "View mission profile",
+            "Update mission profile",
+            "View reserved minute usage",
+            "Scan all regions",
+        ]
+        if session.region:
+            task_choices.append(f"Change region (current: {session.region})")
+        task_choices.append("Quit")
+
+        def needs_region(answers):
+            if answers["task"] in ("Quit", "Scan all regions"):
+                return False
+            return not session.region or answers["task"].startswith("Change region")
+
+        # Task and region are asked in one prompt call, the region question is
+        # only shown when the chosen task needs a region that isn't set yet
+        menu_question = [
+            {
+                "type": "list",
+                "name": "task",
+                "message": "What would you like to do?",
+                "choices": task_choices,
+            },
+            {
+                "type": "list",
+                "name": "region",
+                "message": "Which region would you like to use?",
+                "choices": [
+                    {"name": f"{label} ({region})", "value": region}
+                    for region, label in REGIONS.items()
+                ],
+                "when": needs_region,
+            },
+        ]
 
-    task_answer = prompt(task_question)
-    task = task_answer["task"]
+        menu_answer = prompt(menu_question)
+        task = menu_answer["task"]
+
+        if task == "Quit":
+            return
+
+        # Wait for the background load so the session isn't created twice. It
+        # only warms up the session, so if it failed the clients load the
+        # models themselves and report any real error.
+        try:
+            service_models.result()
+        except Exception:
+            pass
+
+        try:
+            get_account_id()
+        except Exception as e:
+            print("Your AWS credentials couldn't be verified. Exiting to main menu.")
+            print(e)
+            continue
+
+        if task == "Scan all regions":
+            found, failed = scan_mission_profiles(
+                [
+                    region
+                    for region in REGIONS
+                    if region not in session.inaccessible_regions
+                ]
+            )
+            session.inaccessible_regions.update(failed)
+            if not found:
+                print("No mission profiles in any region. Exiting to main menu.")
+                continue
 
-    if task == "Quit":
-        quit()
+            scan_choices = [
+                Separator("    Region          Name             --   ID      ")
+            ]
+            scan_choices.extend(
+                {
+                    "name": f"{region:<15} {profile['name']:<30}  --  {profile['missionProfileId']}",
+                    "value": (region, profile["name"], profile["missionProfileId"]),
+                }
+                for region, profile in found
+            )
+            scan_choices.append("Exit")
+
+            scan_question = [
+                {
+                    "type": "list",
+                    "name": "mission_profile",
+                    "message": "Which mission profile would you like to view?",
+                    "choices": scan_choices,
+                }
+            ]
 
-    region_question = [
-        {
-            "type": "list",
-            "name": "region",
-            "message": "Which region would you like to use?",
-            "choices": [
-                "N. Virginia (us-east-1)",
-                "Ohio (us-east-2)",
-                "Oregon (us-west-2)",
-                "Cape Town (af-south-1)",
-                "Seoul (ap-northeast-2)",
-                "Sydney (ap-southeast-2)",
-                "Frankfurt (eu-central-1)",
-                "Ireland (eu-west-1)",
-                "Stockholm (eu-north-1)",
-                "Bahrain (me-south-1)",
-                "Sao Paulo (sa-east-1)",
-                "Singapore (ap-southeast-1)",
-            ],
-        }
-    ]
+            scan_answer = prompt(scan_question)["mission_profile"]
+            if scan_answer == "Exit":
+                print("No mission profile selected. Exiting to main menu.")
+                continue
+            region, mission_profile_name, mission_profile_id = scan_answer
+
+            # Viewing a profile switches the session to its region
+            session.full_region = f"{REGIONS[region]} ({region})"
+            session.region = region
+            session.gs_client = get_gs_client(region)
+            view_mission_profile(
+                session.gs_client, mission_profile_id, mission_profile_name
+            )
+            continue
 
-    answer = prompt(region_question)
-    full_region = answer["region"]
+        if "region" in menu_answer:
+            region = menu_answer["region"]
 
-    region = full_region[full_region.find("(") + 1 : full_region.find(")")]
+            session.full_region = f"{REGIONS[region]} ({region})"
+            session.region = region
+            session.gs_client = get_gs_client(session.region)
 
-    my_config = Config(
-        region_name=region,
-        signature_version="v4",
-        retries={"max_attempts": 4, "mode": "standard"},
-    )
+            if task.startswith("Change region"):
+                continue
 
-    gs_client = boto3.client("groundstation", config=my_config)
+        full_region = session.full_region
+        gs_client = session.gs_client
 
-    try:
-        mission_profile_list = gs_client.list_mission_profiles()
-    except Exception as e:
-        print(
-            "Your AWS account doesn't have access to this region. Exiting to main menu."
-        )
-        print(e)
-        main()
+        if session.region in session.inaccessible_regions:
+            print(
+                "Your AWS account doesn't have access to this region. Exiting to main menu."
+            )
+            session.region = ""
+            continue
+
+        try:
+            profiles = list_mission_profiles(gs_client)
+        except Exception as e:
+            if is_access_error(e):
+                print(
+                    "Your AWS account doesn't have access to this region. Exiting to main menu."
+                )
+                session.inaccessible_regions.add(session.region)
+                session.region = ""
+            else:
+                print(
+                    "Unable to list the mission profiles in this region. Exiting to main menu."
+                )
+            print(e)
+            continue
 
-    if task == "View reserved minute usage":
-        get_service_usage(gs_client)
+        if task == "View reserved minute usage":
+            get_service_usage(gs_client)
+            continue
 
-    if not mission_profile_list["missionProfileList"]:
-        print("No mission profiles in " + full_region + ". Exiting to main menu.")
-        main()
+        if not profiles:
+            print(f"No mission profiles in {full_region}. Exiting to main menu.")
+            continue
 
-    profile_question = [
-        {
-            "type": "list",
-            "name": "mission_profile_name",
-            "message": "Which mission profile would you like to view?",
-            "choices": get_mission_profile_list(gs_client),
-        }
-    ]
+        profile_question = [
+            {
+                "type": "list",
+                "name": "mission_profile_name",
+                "message": "Which mission profile would you like to view?",
+                "choices": get_mission_profile_list(gs_client, profiles),
+            }
+        ]
+
+        profile_answer = prompt(profile_question)["mission_profile_name"]
+        if profile_answer == "Exit":
+            print("No mission profile selected. Exiting to main menu.")
+            continue
+        mission_profile_name, mission_profile_id = profile_answer
+
+        if task == "View mission profile":
+            view_mission_profile(gs_client, mission_profile_id, mission_profile_name)
+            action = Action.DONE
+        elif task == "Update mission profile":
+            action = update_mission_profile(gs_client, mission_profile_id)
 
-    profile_answer = prompt(profile_question)["mission_profile_name"]
-    if profile_answer == "Exit":
-        print("No mission profile selected. Exiting to main menu.")
-        main()
-    mission_profile_name = profile_answer.split("--")[0].strip()
-    mission_profile_id = profile_answer.split("--")[1].strip()
-
-    if task == "View mission profile":
-        view_mission_profile(gs_client, mission_profile_id, mission_profile_name)
-    elif task == "Update mission profile":
-        update_mission_profile(gs_client, mission_profile_id)
+        if action is Action.QUIT:
+            return
 
 
 if __name__ == "__main__":